@@ -1,46 +1,51 @@
 import argparse
+import json
 import pprint
 
 mem = [0, 0, 0, 0, 0]
 
-def execute(program):
+CONST, READ, WRITE, NEGATE = range(4)
+OPS = {"const": CONST, "read": READ, "write": WRITE, "negate": NEGATE}
+
+def load(program):
+    code = []
     for op, *args in program:
-        if op == "const":
-            const = args[0]
-            adressC = args[1]
-            mem[adressC] = const
-            
-        elif op == "negate":
-            shift = args[0]
-            adressC = args[1]
-            adressD = args[2]
-            adress = mem[adressC] + shift
-            value = mem[adress]
-            mem[mem[adressD]] = -value
-            
-        elif op == "read":
-            adressB = args[0]
-            adressC = args[1]
-            mem[adressC] = mem[adressB]
-            
-        elif op == "write":
-            adressB = args[0]
-            adressC = args[1]
-            mem[adressB] = mem[adressC]
-
-parser = argparse.ArgumentParser()
-parser.add_argument("--path", "-p", help="Путь к файлу с промежуточным представлением")
-parser.add_argument(
-    "--dump",
-    "-d",
-    help="Путь к файлу, куда будет сохранен дамп памяти после выполнения программ",
-)
-parser.add_argument("--range", "-r", help="Диапазон адресов памяти для вывода дампа")
-args = parser.parse_args()
-print(args)
-with open(args.path, "r") as f:
-    program = f.read()
-program = eval(program)
-pprint.pprint(program)
-execute(program)
-print(mem)
+        args += [-1] * (3 - len(args))
+        code.append((OPS[op], *args))
+    return code
+
+def execute(code):
+    m = mem
+    for op, a, b, c in code:
+        if op == CONST:
+            m[b] = a
+
+        elif op == NEGATE:
+            value = m[m[b] + a]
+            m[m[c]] = -value
+
+        elif op == READ:
+            m[b] = m[a]
+
+        elif op == WRITE:
+            m[a] = m[b]
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--path", "-p", help="Путь к файлу с промежуточным представлением")
+    parser.add_argument(
+        "--dump",
+        "-d",
+        help="Путь к файлу, куда будет сохранен дамп памяти после выполнения программ",
+    )
+    parser.add_argument("--range", "-r", help="Диапазон адресов памяти для вывода дампа")
+    args = parser.parse_args()
+    print(args)
+    with open(args.path, "r") as f:
+        program = json.load(f)
+    pprint.pprint(program)
+    execute(load(program))
+    print(mem)
+
+if __name__ == "__main__":
+    main()
@@ -8,6 +8,11 @@ class TerminalEmulator:
         self.setup_window()
         self.create_widgets()
         self.current_dir = os.getcwd()
+        self.commands = {
+            'exit': self.cmd_exit,
+            'ls': self.cmd_ls,
+            'cd': self.cmd_cd,
+        }
         
     def setup_window(self):
         username = os.getlogin() or 'user'
@@ -18,6 +23,8 @@ class TerminalEmulator:
     def create_widgets(self):
         self.output = tk.Text(self.root, bg='black', fg='white', font=('Courier', 11))
         self.output.pack(fill='both', expand=True, padx=5, pady=5)
+        for c in ('white', 'red', 'green', 'yellow', 'cyan'):
+            self.output.tag_configure(f'color_{c}', foreground=c)
         input_frame = tk.Frame(self.root)
         input_frame.pack(fill='x', padx=5, pady=5)
         username = os.getenv('USER') or 'user'
@@ -29,45 +36,65 @@ class TerminalEmulator:
         self.entry.focus()
         
     def print_text(self, text, color='white'):
-        self.output.insert('end', text + '\n')
+        self.output.insert('end', text + '\n', f'color_{color}')
+        self.output.see('end')
+
+    def print_lines(self, lines):
+        run, run_color = [], None
+        for text, color in lines:
+            if run and color != run_color:
+                self.output.insert('end', ''.join(run), f'color_{run_color}')
+                run = []
+            run.append(text + '\n')
+            run_color = color
+        if run:
+            self.output.insert('end', ''.join(run), f'color_{run_color}')
         self.output.see('end')
         
     def run_command(self, event):
         command = self.entry.get().strip()
         self.entry.delete(0, 'end')
-        self.print_text(self.prompt + command)
+        out = [(self.prompt + command, 'white')]
         
         try:
-            parts = shlex.split(command)
+            if '"' in command or "'" in command or '\\' in command:
+                parts = shlex.split(command)
+            else:
+                parts = command.split()
             if not parts:
                 return
                 
             cmd = parts[0]
             args = parts[1:] if len(parts) > 1 else []
             
-            if cmd == 'exit':
-                self.root.quit()
-                
-            elif cmd == 'ls':
-                self.print_text(f"команда: ls")
-                self.print_text(f"аргументы: {args}")
-                
-            elif cmd == 'cd':
-                self.print_text(f"команда: cd")
-                self.print_text(f"аргументы: {args}")
-                
-                if len(args) > 1:
-                    self.print_text("ошибка: слишком много аргументов", 'red')
-                elif args:
-                    self.print_text(f"переход в: {args[0]}", 'green')
-                else:
-                    self.print_text("переход в домашнюю директорию", 'green')
-                    
+            handler = self.commands.get(cmd)
+            if handler:
+                handler(args, out)
             else:
-                self.print_text(f"ошибка: команда '{cmd}' не найдена", 'red')
+                out.append((f"ошибка: команда '{cmd}' не найдена", 'red'))
                 
         except Exception as e:
-            self.print_text(f"ошибка разбора команды: {e}", 'red')
+            out.append((f"ошибка разбора команды: {e}", 'red'))
+        finally:
+            self.print_lines(out)
+
+    def cmd_exit(self, args, out):
+        self.root.quit()
+
+    def cmd_ls(self, args, out):
+        out.append((f"команда: ls", 'white'))
+        out.append((f"аргументы: {args}", 'white'))
+
+    def cmd_cd(self, args, out):
+        out.append((f"команда: cd", 'white'))
+        out.append((f"аргументы: {args}", 'white'))
+        
+        if len(args) > 1:
+            out.append(("ошибка: слишком много аргументов", 'red'))
+        elif args:
+            out.append((f"переход в: {args[0]}", 'green'))
+        else:
+            out.append(("переход в домашнюю директорию", 'green'))
 if __name__ == "__main__":
     root = tk.Tk()
     app = TerminalEmulator(root)